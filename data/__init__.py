@@ -24,7 +24,7 @@ class Data:
         # NB: Can return none, but shouldn't matter?
         self.current_game: Game = self.schedule.get_preferred_game()
 
-        self.game_changed_time = time.time()
+        self.game_changed_time = time.monotonic()
         if self.current_game is not None:
             self.print_game_data_debug()
             self.__update_layout_state()
@@ -87,7 +87,7 @@ class Data:
 
         if game.game_id != self.current_game.game_id:
             self.current_game = game
-            self.game_changed_time = time.time()
+            self.game_changed_time = time.monotonic()
             self.__update_layout_state()
             self.print_game_data_debug()
             self.network_issues = False
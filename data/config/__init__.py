@@ -78,9 +78,8 @@ class Config:
             self.scrolling_speed = SCROLLING_SPEEDS[json["scrolling_speed"]]
         except IndexError:
             debug.warning(
-                "Scrolling speed should be an integer between 0 and 6. Using default value of {}".format(
-                    DEFAULT_SCROLLING_SPEED
-                )
+                "Scrolling speed should be an integer between 0 and 6. Using default value of %s",
+                DEFAULT_SCROLLING_SPEED,
             )
             self.scrolling_speed = SCROLLING_SPEEDS[DEFAULT_SCROLLING_SPEED]
 
@@ -216,7 +215,7 @@ class Config:
         if os.path.isfile(path):
             j = json.load(open(path))
         else:
-            debug.info(f"Could not find json file {path}.  Skipping.")
+            debug.info("Could not find json file %s.  Skipping.", path)
         return j
 
     # example config is a "base config" which always gets read.
@@ -4,13 +4,18 @@ from driver import graphics
 class Color:
     def __init__(self, color_json):
         self.json = color_json
+        self.graphics_color_cache = {}
 
     def color(self, keypath):
         return self.__find_at_keypath(keypath)
 
     def graphics_color(self, keypath):
+        if keypath in self.graphics_color_cache:
+            return self.graphics_color_cache[keypath]
+
         color = self.color(keypath)
-        return graphics.Color(color["r"], color["g"], color["b"])
+        self.graphics_color_cache[keypath] = graphics.Color(color["r"], color["g"], color["b"])
+        return self.graphics_color_cache[keypath]
 
     def __find_at_keypath(self, keypath):
         keys = keypath.split(".")
@@ -22,6 +22,7 @@ class Layout:
         self.width = width
         self.height = height
         self.state = None
+        self.coords_cache = {}
         self.default_font_name = FONTNAME_DEFAULT
         self.default_font_name = self.coords("defaults.font_name")
 
@@ -53,16 +54,26 @@ class Layout:
             return self.__get_font_object(self.default_font_name)
 
     def coords(self, keypath):
+        # Coordinates are looked up every frame, so cache them per layout state
+        state = self.state
+        cache_key = (state, keypath)
+        if cache_key in self.coords_cache:
+            return self.coords_cache[cache_key]
+
+        self.coords_cache[cache_key] = self.__resolve_coords(keypath, state)
+        return self.coords_cache[cache_key]
+
+    def __resolve_coords(self, keypath, state):
         try:
             coord_dict = self.__find_at_keypath(keypath)
         except KeyError as e:
             raise e
 
-        if not isinstance(coord_dict, dict) or not self.state in AVAILABLE_OPTIONAL_KEYS:
+        if not isinstance(coord_dict, dict) or not state in AVAILABLE_OPTIONAL_KEYS:
             return coord_dict
 
-        if self.state in coord_dict:
-            return coord_dict[self.state]
+        if state in coord_dict:
+            return coord_dict[state]
 
         return coord_dict
 
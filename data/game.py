@@ -50,6 +50,8 @@ class Game:
         self._api_refresh_rate = api_refresh_rate
         self._status = {}
         self._uniform_data = Uniforms(game_id)
+        # Bumped whenever the game data is replaced so renderers can tell when to rebuild their views
+        self.revision = 0
 
     def update(self, force=False, testing_params={}) -> UpdateStatus:
         if force or self.__should_update():
@@ -62,6 +64,7 @@ class Game:
                 self._data_wait_queue.push(live_data)
                 self._current_data = self._data_wait_queue.peek()
                 self._status = self._current_data["gameData"]["status"]
+                self.revision += 1
                 if live_data["gameData"]["datetime"]["officialDate"] > self.date:
                     # this is odd, but if a game is postponed then the 'game' endpoint gets the rescheduled game
                     debug.log("Getting game status from schedule for game with strange date!")
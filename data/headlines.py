@@ -125,7 +125,7 @@ class Headlines:
                             debug.log("Fetched feed '%s' with %d entries.", title, len(f.entries))
                             feeds.append(f)
                         except AttributeError:
-                            debug.warning("There was a problem fetching {}".format(url))
+                            debug.warning("There was a problem fetching %s", url)
                             status = UpdateStatus.FAIL
                 self.feed_data = feeds
         else:
@@ -191,7 +191,7 @@ class Headlines:
         feed_name = MLB_FEEDS.get(team_name, None)
 
         if feed_name is None:
-            debug.error(f"Failed to fetch MLB feed name for key '{team_name}', falling back to default feed.")
+            debug.error("Failed to fetch MLB feed name for key '%s', falling back to default feed.", team_name)
             feed_name = MLB_FEEDS["MLB"]
 
         return "{}/{}/{}".format(MLB_BASE, feed_name, MLB_PATH)
@@ -200,7 +200,9 @@ class Headlines:
         feed_name = TRADE_FEEDS.get(team_name, None)
 
         if feed_name is None:
-            debug.error(f"Failed to fetch MLB Trade Rumors feed name for key '{team_name}', falling back to default feed.")
+            debug.error(
+                "Failed to fetch MLB Trade Rumors feed name for key '%s', falling back to default feed.", team_name
+            )
             feed_name = ""
 
         return "{}/{}/{}".format(TRADE_BASE, feed_name, TRADE_PATH)
@@ -165,9 +165,9 @@ WARMUP = "Warmup"  # Live
 WRITING = "Writing"  # Other
 REVIEW = "Review"  # Not in json
 
-GAME_STATE_INNING_LIVE = [Inning.TOP, Inning.BOTTOM]
+GAME_STATE_INNING_LIVE = {Inning.TOP, Inning.BOTTOM}
 
-GAME_STATE_LIVE = [
+GAME_STATE_LIVE = {
     IN_PROGRESS,
     WARMUP,
     INSTANT_REPLAY,
@@ -217,11 +217,11 @@ GAME_STATE_LIVE = [
     UMPIRE_REVIEW_SHIFT_VIOLATION,
     UMPIRE_CHALLENGE_PITCH_RESULT,
     PLAYER_CHALLENGE_PITCH_RESULT,
-]
+}
 
-GAME_STATE_PREGAME = [SCHEDULED, PREGAME, WARMUP]
+GAME_STATE_PREGAME = {SCHEDULED, PREGAME, WARMUP}
 
-GAME_STATE_COMPLETE = [
+GAME_STATE_COMPLETE = {
     COMPLETED_EARLY,
     COMPLETED_EARLY_COLD,
     COMPLETED_EARLY_FOG,
@@ -243,11 +243,11 @@ GAME_STATE_COMPLETE = [
     GAME_OVER,
     GAME_OVER_TIE_DECISION_BY_TIEBREAKER,
     GAME_OVER_TIED,
-]
+}
 
-GAME_STATE_FRESH = [IN_PROGRESS, GAME_OVER, GAME_OVER_TIED, GAME_OVER_TIE_DECISION_BY_TIEBREAKER]
+GAME_STATE_FRESH = {IN_PROGRESS, GAME_OVER, GAME_OVER_TIED, GAME_OVER_TIE_DECISION_BY_TIEBREAKER}
 
-GAME_STATE_IRREGULAR = [
+GAME_STATE_IRREGULAR = {
     CANCELLED,
     CANCELLED_COLD,
     CANCELLED_COVID19,
@@ -382,7 +382,7 @@ GAME_STATE_IRREGULAR = [
     PLAYER_CHALLENGE_PITCH_RESULT,
     WRITING,
     UNKNOWN,
-]
+}
 
 
 def is_pregame(status):
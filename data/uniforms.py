@@ -52,7 +52,7 @@ class Uniforms:
                 ):
                     self.away_special = uniform
         except Exception:
-            debug.exception(f"Error while fetching game {self.game_id} uniform data")
+            debug.exception("Error while fetching game %s uniform data", self.game_id)
 
     def __should_update(self):
         endtime = time.time()
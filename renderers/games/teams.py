@@ -3,6 +3,9 @@ from driver import graphics
 ABSOLUTE = "absolute"
 RELATIVE = "relative"
 
+# Team colors are static config, so the driver color objects can be shared between frames
+__graphics_colors = {}
+
 def render_team_banner(
     canvas, layout, team_colors, home_team, away_team, full_team_names, short_team_names_for_runs_hits, show_score,
 ):
@@ -73,7 +76,7 @@ def can_use_full_team_names(canvas, enabled, abbreviate_on_overflow, teams):
 
 
 def __render_team_text(canvas, layout, text_color, team, homeaway, full_team_names):
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+    text_color_graphic = __graphics_color(text_color)
     coords = layout.coords("teams.name.{}".format(homeaway))
     font = layout.font("teams.name.{}".format(homeaway))
     team_text = "{:3s}".format(team.abbrev.upper()).strip()
@@ -89,7 +92,7 @@ def __render_record_text(canvas, layout, text_color, team, homeaway, origin):
     if not layout.coords("teams.record").get("enabled", False):
         return
 
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+    text_color_graphic = __graphics_color(text_color)
     coords = layout.coords("teams.record.{}".format(homeaway))
     font = layout.font("teams.record.{}".format(homeaway))
     record_text = "({}-{})".format(team.record["wins"], team.record["losses"])
@@ -108,7 +111,7 @@ def __render_score_component(canvas, layout, text_color, homeaway, coords, compo
     font_width = font["size"]["width"]
     # Number of pixels between runs/hits and hits/errors.
     rhe_coords = layout.coords("teams.runs.runs_hits_errors")
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+    text_color_graphic = __graphics_color(text_color)
     component_val = str(component_val)
     # Draw each digit from right to left.
     for i, c in enumerate(component_val[::-1]):
@@ -132,12 +135,25 @@ def __render_team_score(canvas, layout, text_color, team, homeaway, score_spacin
         )
     __render_score_component(canvas, layout, text_color, homeaway, coords, team.runs, score_spacing["runs"])
 
+def __graphics_color(color):
+    key = (color["r"], color["g"], color["b"])
+    if key not in __graphics_colors:
+        __graphics_colors[key] = graphics.Color(*key)
+    return __graphics_colors[key]
+
 def __draw_filled_box(canvas, coords, color):
-        c = graphics.Color(color["r"], color["g"], color["b"])
+        c = __graphics_color(color)
 
         x = coords["x"]
         y = coords["y"]
         w = coords["width"]
+        h = coords["height"]
 
-        for h in range(coords["height"]):
-            graphics.DrawLine(canvas, x, y + h, x + w, y + h, c)
+        # Fill along the longer side so thin boxes like the accent take as few driver calls as possible.
+        # Rows span x through x + w inclusive, so there are w + 1 columns to cover.
+        if h > w + 1:
+            for dx in range(w + 1):
+                graphics.DrawLine(canvas, x + dx, y, x + dx, y + h - 1, c)
+        else:
+            for dy in range(h):
+                graphics.DrawLine(canvas, x, y + dy, x + w, y + dy, c)
@@ -25,10 +25,14 @@ class MainRenderer:
         self.is_playoffs = self.data.schedule.date > self.data.headlines.important_dates.playoffs_start_date.date()
         self.canvas = matrix.CreateFrameCanvas()
         self.scrolling_text_pos = self.canvas.width
-        self.game_changed_time = time.time()
+        self.game_changed_time = time.monotonic()
         self.animation_time = 0
         self.standings_stat = "w"
         self.standings_league = "NL"
+        self.game_views = {}
+
+        bgcolor = self.data.config.scoreboard_colors.color("default.background")
+        self.background_rgb = (bgcolor["r"], bgcolor["g"], bgcolor["b"])
 
     def render(self):
         screen = self.data.get_screen_type()
@@ -74,6 +78,7 @@ class MainRenderer:
     # May also call draw_offday or draw_standings if there are no games
     def __render_gameday(self) -> NoReturn:
         refresh_rate = self.data.config.scrolling_speed
+        frame_time = time.monotonic()
         while True:
             if not self.data.schedule.games_live():
                 if self.data.config.news_no_games and self.data.config.standings_no_games:
@@ -88,25 +93,26 @@ class MainRenderer:
             if self.game_changed_time < self.data.game_changed_time:
                 self.scrolling_text_pos = self.canvas.width
                 self.data.scrolling_finished = not self.data.config.rotation_scroll_until_finished
-                self.game_changed_time = time.time()
+                self.game_changed_time = time.monotonic()
 
             # Draw the current game
             self.__draw_game()
 
-            time.sleep(refresh_rate)
+            frame_time = pace_frame(frame_time, refresh_rate)
 
     # Draws the provided game on the canvas
     def __draw_game(self):
         game = self.data.current_game
-        bgcolor = self.data.config.scoreboard_colors.color("default.background")
-        self.canvas.Fill(bgcolor["r"], bgcolor["g"], bgcolor["b"])
-        scoreboard = Scoreboard(game)
+        self.canvas.Fill(*self.background_rgb)
+        scoreboard = self.__game_view(Scoreboard, game)
         layout = self.data.config.layout
         colors = self.data.config.scoreboard_colors
+        game_status = game.status()
+        is_pregame = status.is_pregame(game_status)
 
-        if status.is_pregame(game.status()):  # Draw the pregame information
+        if is_pregame:  # Draw the pregame information
             self.__max_scroll_x(layout.coords("pregame.scrolling_text"))
-            pregame = Pregame(game, self.data.config.time_format)
+            pregame = self.__game_view(Pregame, game, self.data.config.time_format)
             pos = pregamerender.render_pregame(
                 self.canvas,
                 layout,
@@ -118,16 +124,16 @@ class MainRenderer:
             )
             self.__update_scrolling_text_pos(pos, self.canvas.width)
 
-        elif status.is_complete(game.status()):  # Draw the game summary
+        elif status.is_complete(game_status):  # Draw the game summary
             self.__max_scroll_x(layout.coords("final.scrolling_text"))
-            final = Postgame(game)
+            final = self.__game_view(Postgame, game)
             pos = postgamerender.render_postgame(
                 self.canvas, layout, colors, final, scoreboard, self.scrolling_text_pos, self.is_playoffs
             )
             self.__update_scrolling_text_pos(pos, self.canvas.width)
 
-        elif status.is_irregular(game.status()):  # Draw game status
-            short_text = self.data.config.layout.coords("status.text")["short_text"]
+        elif status.is_irregular(game_status):  # Draw game status
+            short_text = layout.coords("status.text")["short_text"]
             if scoreboard.get_text_for_reason():
                 self.__max_scroll_x(layout.coords("status.scrolling_text"))
                 pos = irregular.render_irregular_status(
@@ -145,9 +151,9 @@ class MainRenderer:
                 self.animation_time = 0
 
             if status.is_inning_break(scoreboard.inning.state):
-                loop_point = self.data.config.layout.coords("inning.break.due_up")["loop"]
+                loop_point = layout.coords("inning.break.due_up")["loop"]
             else:
-                loop_point = self.data.config.layout.coords("atbat")["loop"]
+                loop_point = layout.coords("atbat")["loop"]
 
             self.scrolling_text_pos = min(self.scrolling_text_pos, loop_point)
             pos = gamerender.render_live_game(
@@ -164,7 +170,7 @@ class MainRenderer:
             scoreboard.away_team,
             self.data.config.full_team_names,
             self.data.config.short_team_names_for_runs_hits,
-            show_score=not status.is_pregame(game.status()),
+            show_score=not is_pregame,
         )
 
         # Show network issues
@@ -173,19 +179,30 @@ class MainRenderer:
 
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
+    def __game_view(self, view, game, *args):
+        """Returns view(game, *args), reusing the last one built until the game receives new data"""
+        key = (game, game.revision) + args
+        cached = self.game_views.get(view)
+        if cached is None or cached[0] != key:
+            cached = (key, view(game, *args))
+            self.game_views[view] = cached
+        return cached[1]
+
     def __draw_news(self, cond: Callable[[], bool]):
         """
         Draw the news screen for as long as cond returns True
         """
-        color = self.data.config.scoreboard_colors.color("default.background")
+        layout = self.data.config.layout
+        colors = self.data.config.scoreboard_colors
+        frame_time = time.monotonic()
         while cond():
-            self.canvas.Fill(color["r"], color["g"], color["b"])
+            self.canvas.Fill(*self.background_rgb)
 
-            self.__max_scroll_x(self.data.config.layout.coords("offday.scrolling_text"))
+            self.__max_scroll_x(layout.coords("offday.scrolling_text"))
             pos = offday.render_offday_screen(
                 self.canvas,
-                self.data.config.layout,
-                self.data.config.scoreboard_colors,
+                layout,
+                colors,
                 self.data.weather,
                 self.data.headlines,
                 self.data.config.time_format,
@@ -197,9 +214,9 @@ class MainRenderer:
             self.__update_scrolling_text_pos(pos, self.canvas.width)
             # Show network issues
             if self.data.network_issues:
-                network.render_network_error(self.canvas, self.data.config.layout, self.data.config.scoreboard_colors)
+                network.render_network_error(self.canvas, layout, colors)
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
-            time.sleep(self.data.config.scrolling_speed)
+            frame_time = pace_frame(frame_time, self.data.config.scrolling_speed)
 
     def __draw_standings(self, cond: Callable[[], bool]):
         """
@@ -211,30 +228,34 @@ class MainRenderer:
         if self.data.standings.is_postseason() and self.canvas.width <= 32:
             return
 
+        layout = self.data.config.layout
+        colors = self.data.config.scoreboard_colors
         update = 1
+        frame_time = time.monotonic()
+        rendered_frame = None
         while cond():
-            if self.data.standings.is_postseason():
-                standings.render_bracket(
-                    self.canvas,
-                    self.data.config.layout,
-                    self.data.config.scoreboard_colors,
-                    self.data.standings.leagues[self.standings_league],
-                )
+            is_postseason = self.data.standings.is_postseason()
+            if is_postseason:
+                shown = self.data.standings.leagues[self.standings_league]
             else:
-                standings.render_standings(
-                    self.canvas,
-                    self.data.config.layout,
-                    self.data.config.scoreboard_colors,
-                    self.data.standings.current_standings(),
-                    self.standings_stat,
-                )
+                shown = self.data.standings.current_standings()
+
+            # Standings refresh every few minutes, so only redraw when the screen would actually change.
+            # The standings data is replaced rather than mutated on refresh, so comparing by identity is enough.
+            frame = (shown, self.standings_stat, self.data.network_issues)
+            if frame != rendered_frame:
+                if is_postseason:
+                    standings.render_bracket(self.canvas, layout, colors, shown)
+                else:
+                    standings.render_standings(self.canvas, layout, colors, shown, self.standings_stat)
 
-            if self.data.network_issues:
-                network.render_network_error(self.canvas, self.data.config.layout, self.data.config.scoreboard_colors)
+                if self.data.network_issues:
+                    network.render_network_error(self.canvas, layout, colors)
 
-            self.canvas = self.matrix.SwapOnVSync(self.canvas)
+                self.canvas = self.matrix.SwapOnVSync(self.canvas)
+                rendered_frame = frame
 
-            if self.data.standings.is_postseason():
+            if is_postseason:
                 if update % 20 == 0:
                     if self.standings_league == "NL":
                         self.standings_league = "AL"
@@ -249,7 +270,7 @@ class MainRenderer:
             elif self.canvas.width > 32 and update % 10 == 0:
                 self.data.standings.advance_to_next_standings()
 
-            time.sleep(1)
+            frame_time = pace_frame(frame_time, 1)
             update = (update + 1) % 100
 
     def __max_scroll_x(self, scroll_coords):
@@ -276,18 +297,47 @@ def permanent_cond() -> bool:
     return True
 
 
+def pace_frame(frame_time, interval) -> float:
+    """Sleep until one interval after frame_time and return the time of the next frame.
+    Drawing time counts against the interval. If a frame overran, the schedule restarts from now
+    instead of rushing extra frames to catch up."""
+    next_frame_time = frame_time + interval
+    delay = next_frame_time - time.monotonic()
+    if delay <= 0:
+        return time.monotonic()
+
+    time.sleep(delay)
+    return next_frame_time
+
+
 def timer_cond(seconds) -> Callable[[], bool]:
     """Create a condition that is true for the specified number of seconds"""
-    end = time.time() + seconds
+    end = time.monotonic() + seconds
 
     def cond():
-        return time.time() < end
+        return time.monotonic() < end
 
     return cond
 
 
 def all_of(*conds) -> Callable[[], bool]:
     """Create a condition that is true if all of the given conditions are true"""
+    # permanent_cond never changes the result, so don't poll it
+    conds = tuple(c for c in conds if c is not permanent_cond)
+    if not conds:
+        return permanent_cond
+
+    if len(conds) == 1:
+        return conds[0]
+
+    # The render loops poll this every frame, so skip the generator for the common pair of conditions
+    if len(conds) == 2:
+        first, second = conds
+
+        def cond():
+            return first() and second()
+
+        return cond
 
     def cond():
         return all(c() for c in conds)
@@ -1,5 +1,5 @@
 import os, re, unittest
-from data.config.layout import Layout, FONTNAME_DEFAULT, FONTNAME_KEY, DIR_FONT_PATCHED
+from data.config.layout import Layout, FONTNAME_DEFAULT, FONTNAME_KEY, DIR_FONT_PATCHED, LAYOUT_STATE_WARMUP
 
 class TestLayout(unittest.TestCase):
 
@@ -25,6 +25,27 @@ class TestLayout(unittest.TestCase):
         # Handled differently in HW/Sw
         self.assertIn("font", font_dict)
 
+    def test_coords_follow_layout_state(self):
+        layout = Layout({
+            "defaults": {
+                FONTNAME_KEY: FONTNAME_DEFAULT
+            },
+            "test": {
+                "x": 1,
+                LAYOUT_STATE_WARMUP: {
+                    "x": 2
+                }
+            }
+        }, 32, 32)
+
+        self.assertEqual(layout.coords("test")["x"], 1)
+
+        layout.set_state(LAYOUT_STATE_WARMUP)
+        self.assertEqual(layout.coords("test")["x"], 2)
+
+        layout.set_state()
+        self.assertEqual(layout.coords("test")["x"], 1)
+
     def test_font_sizes_parsed_correctly(self):
         pattern = re.compile("((\\d+).*x(\\d+).*\\.bdf)")
 
@@ -61,9 +61,11 @@ class TestGame(unittest.TestCase):
         game = data.game.Game.from_scheduled(self.game_data, delay=1, api_refresh_rate=10)
         self.assertIsNotNone(game)
         self.assertEqual(game.current_delay(), 0)
+        self.assertEqual(game.revision, 1)
 
         self.assertEqual(game.update(force=True, testing_params={"timecode": "20190817_230958"}), UpdateStatus.SUCCESS)
         self.assertEqual(game.current_delay(), 10)
+        self.assertEqual(game.revision, 2)
         # at this point, should still be 'delayed' (meaning the data is from the end of the game)
         self.assertEqual(game.status(), "Final")
 
@@ -91,6 +93,20 @@ class TestGame(unittest.TestCase):
         self.assertEqual(game.last_pitch(), (88.6, 'FC', 'Cutter'))
         self.assertEqual(game.current_pitcher_pitch_count(), 12)
 
+    def test_revision_bumps_when_update_fails_after_new_data(self):
+        game = data.game.Game.from_scheduled(self.game_data, delay=0, api_refresh_rate=10)
+        self.assertIsNotNone(game)
+        revision = game.revision
+
+        # the new data is already in place when the uniform refresh fails, so views built from it must be rebuilt
+        with unittest.mock.patch.object(game._uniform_data, "update", side_effect=Exception):
+            self.assertEqual(
+                game.update(force=True, testing_params={"timecode": "20190817_231033"}), UpdateStatus.FAIL
+            )
+
+        self.assertEqual(game.status(), "In Progress")
+        self.assertEqual(game.revision, revision + 1)
+
 
     def test_special_status_game(self):
         # https://www.mlb.com/news/tigers-nearly-combine-for-no-hitter-against-orioles